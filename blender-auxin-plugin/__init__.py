@@ -16,9 +16,14 @@ bl_info = {
 
 import bpy
 import subprocess
-import json
+import functools
 import os
+import re
+import shutil
+import sys
 import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from bpy.props import (
     StringProperty,
     BoolProperty,
@@ -30,9 +35,74 @@ from bpy.types import (
     Operator,
     Panel,
     PropertyGroup,
+    UIList,
     AddonPreferences,
 )
 
+# JSON modules, imported on first use so add-on registration at Blender
+# startup doesn't pay for them; see _get_json() and json_loads()
+_json = None
+_json_loads = None
+
+# Worker for auxin CLI calls so network-bound commands (push, pull, commit)
+# never block Blender's main thread. A single thread runs jobs one at a time,
+# in submission order, so two commands never change the repository at once.
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="auxin")
+
+# In-flight operator commands, keyed by operator bl_idname
+_PENDING = {}
+
+# "Auxin CLI Path" preference as entered, or None to use PATH. Kept here so
+# worker threads never read bpy preferences; see auxin_cli().
+_AUXIN_PATH = None
+
+# Scene metadata appended to commit messages, filled from extract_scene_metadata()
+_COMMIT_METADATA_TEMPLATE = (
+    "\n\n"
+    "Scenes: {scene_count}\n"
+    "Active Scene: {active_scene}\n"
+    "Objects: {object_count}\n"
+    "Meshes: {mesh_count}\n"
+    "Lights: {light_count}\n"
+    "Cameras: {camera_count}\n"
+    "Materials: {material_count}\n"
+    "Render Engine: {render_engine}\n"
+    "Resolution: {resolution_x}x{resolution_y}\n"
+    "Frame Range: {frame_start}-{frame_end}\n"
+    "FPS: {fps}\n"
+    "Blender Version: {blender_version}"
+)
+
+# Result of the last successful status check, as (repo_initialized,
+# last_status), keyed by the .blend file's (path, mtime) at that check
+_STATUS_CACHE = {"key": None, "val": None}
+
+# Markers in `auxin status` / `auxin lock status` output. Searching with
+# IGNORECASE avoids lowercasing a copy of the whole output.
+_NOT_REPO_RE = re.compile(r"not an oxen repository", re.IGNORECASE)
+_NOT_LOCKED_RE = re.compile(r"not locked|no lock", re.IGNORECASE)
+
+# Environment overrides for auxin subprocesses: plain C locale and no ANSI
+# colour codes (honoured by the CLI's `colored` crate), so output parses the
+# same on every machine
+AUXIN_ENV_OVERRIDES = {"LC_ALL": "C", "NO_COLOR": "1"}
+
+# Terminal emulators tried, in order, by the Open Terminal operator on Linux
+LINUX_TERMINALS = ("gnome-terminal", "konsole", "xterm", "terminator")
+
+# Number of commits fetched per history refresh, and added per Load More
+HISTORY_LIMIT = 50
+
+
+# Object-type tallies for extract_scene_metadata(), keyed by the file path and
+# datablock counts so panel redraws don't rescan bpy.data.objects. Changing an
+# object's type (e.g. Convert To) adds an object-data block, which the key
+# catches; the Refresh Metadata operator clears the cache for anything else.
+_META_CACHE = {"key": None, "val": None}
+
+# Size of the saved .blend file, keyed by path; cleared by the save/load handlers
+_FILE_SIZE_CACHE = {"key": None, "val": 0}
+
 # =============================================================================
 # Utility Functions
 # =============================================================================
@@ -48,8 +118,41 @@ def get_blend_file():
     """Get the current .blend file path."""
     return bpy.data.filepath
 
-def run_auxin_command(args, cwd=None):
-    """Run an auxin CLI command and return the result."""
+def _get_json():
+    """Get the standard library json module, importing it on first use."""
+    global _json
+    if _json is None:
+        import json
+        _json = json
+    return _json
+
+def json_loads(data):
+    """Parse JSON from str or bytes, with orjson when it is installed."""
+    global _json_loads
+    if _json_loads is None:
+        try:
+            from orjson import loads
+        except ImportError:
+            loads = _get_json().loads
+        _json_loads = loads
+    return _json_loads(data)
+
+@functools.lru_cache(maxsize=None)
+def find_linux_terminal():
+    """Get the first installed terminal from LINUX_TERMINALS, or None."""
+    return next((term for term in LINUX_TERMINALS if shutil.which(term)), None)
+
+def auxin_cli(cwd):
+    """Get the auxin CLI to run, resolving a //-relative path against cwd."""
+    path = _AUXIN_PATH
+    if not path:
+        return "auxin"
+    if path.startswith("//"):
+        return os.path.join(cwd, path[2:])
+    return os.path.expanduser(path)
+
+def run_auxin_command(args, cwd=None, raw=False):
+    """Run an auxin CLI command and return the result (output as bytes if raw)."""
     if cwd is None:
         cwd = get_project_path()
 
@@ -57,19 +160,20 @@ def run_auxin_command(args, cwd=None):
         return {"success": False, "error": "No project directory - save your file first"}
 
     try:
-        cmd = ["auxin"] + args
+        cmd = [auxin_cli(cwd)] + args
         result = subprocess.run(
             cmd,
             cwd=cwd,
+            env={**os.environ, **AUXIN_ENV_OVERRIDES},
             capture_output=True,
-            text=True,
             timeout=60
         )
 
         if result.returncode == 0:
-            return {"success": True, "output": result.stdout, "stderr": result.stderr}
+            output = result.stdout if raw else result.stdout.decode("utf-8", "replace")
+            return {"success": True, "output": output, "stderr": result.stderr}
         else:
-            return {"success": False, "error": result.stderr or result.stdout}
+            return {"success": False, "error": (result.stderr or result.stdout).decode("utf-8", "replace")}
     except FileNotFoundError:
         return {"success": False, "error": "auxin CLI not found. Please install auxin."}
     except subprocess.TimeoutExpired:
@@ -77,14 +181,70 @@ def run_auxin_command(args, cwd=None):
     except Exception as e:
         return {"success": False, "error": str(e)}
 
+def _count_objects_by_type():
+    """Count objects per type, rescanning only when the datablock counts change."""
+    data = bpy.data
+    key = (
+        data.filepath,
+        len(data.objects),
+        len(data.meshes),
+        len(data.lights),
+        len(data.cameras),
+        len(data.curves),
+        len(data.metaballs),
+    )
+
+    if _META_CACHE["key"] != key:
+        _META_CACHE["key"] = key
+        _META_CACHE["val"] = Counter(obj.type for obj in data.objects)
+
+    return _META_CACHE["val"]
+
+def _get_file_size(filepath):
+    """Get the size of the saved .blend file, cached until the next save or load."""
+    if _FILE_SIZE_CACHE["key"] != filepath:
+        file_size = 0
+        if filepath:
+            try:
+                file_size = os.stat(filepath).st_size
+            except OSError:
+                pass
+        _FILE_SIZE_CACHE["key"] = filepath
+        _FILE_SIZE_CACHE["val"] = file_size
+
+    return _FILE_SIZE_CACHE["val"]
+
+def _status_key():
+    """Identify the saved state of the .blend file for the status memo."""
+    filepath = bpy.data.filepath
+    try:
+        return (filepath, os.stat(filepath).st_mtime_ns)
+    except OSError:
+        return None
+
+def _remember_status(key, props):
+    """Record the status just applied to ``props`` for the file state ``key``."""
+    _STATUS_CACHE["key"] = key
+    _STATUS_CACHE["val"] = (props.repo_initialized, props.last_status)
+
+def _invalidate_status_cache():
+    """Force the next status check to run after the repository changed."""
+    _STATUS_CACHE["key"] = None
+
+def _invalidate_metadata_cache():
+    """Forget cached metadata after the .blend file is saved or reloaded."""
+    _META_CACHE["key"] = None
+    _FILE_SIZE_CACHE["key"] = None
+
 def extract_scene_metadata():
     """Extract metadata from the current Blender scene for commit messages."""
     scene = bpy.context.scene
 
     # Count objects by type
-    mesh_count = len([obj for obj in bpy.data.objects if obj.type == 'MESH'])
-    light_count = len([obj for obj in bpy.data.objects if obj.type == 'LIGHT'])
-    camera_count = len([obj for obj in bpy.data.objects if obj.type == 'CAMERA'])
+    counts = _count_objects_by_type()
+    mesh_count = counts['MESH']
+    light_count = counts['LIGHT']
+    camera_count = counts['CAMERA']
     total_objects = len(bpy.data.objects)
 
     # Get other stats
@@ -105,10 +265,7 @@ def extract_scene_metadata():
     blender_version = f"{bpy.app.version[0]}.{bpy.app.version[1]}.{bpy.app.version[2]}"
 
     # File size
-    filepath = bpy.data.filepath
-    file_size = 0
-    if filepath and os.path.exists(filepath):
-        file_size = os.path.getsize(filepath)
+    file_size = _get_file_size(bpy.data.filepath)
 
     return {
         "scene_count": scene_count,
@@ -128,16 +285,115 @@ def extract_scene_metadata():
         "file_size": file_size,
     }
 
+def update_metadata_cache(scene):
+    """Store the current scene metadata on the scene for the commit panel to display."""
+    scene.auxin.metadata_cache = _get_json().dumps(extract_scene_metadata())
+
+def _update_include_metadata(self, context):
+    """Capture metadata as soon as Include Metadata is switched on."""
+    if self.include_metadata:
+        update_metadata_cache(context.scene)
+
+def apply_status_result(props, result):
+    """Update the repository status properties from an ``auxin status`` result."""
+    if result["success"]:
+        # Parse status output to check if initialized
+        output = result["output"]
+        if _NOT_REPO_RE.search(output):
+            props.repo_initialized = False
+            props.last_status = "Not initialized"
+        else:
+            props.repo_initialized = True
+            # Count changes
+            lines = output.strip().split("\n")
+            props.last_status = f"{len(lines)} file(s) changed"
+    else:
+        if _NOT_REPO_RE.search(result["error"]):
+            props.repo_initialized = False
+            props.last_status = "Not initialized"
+        else:
+            props.last_status = result["error"]
+
+def merge_commit_history(props, commits_data):
+    """Prepend commits newer than the current head, rebuilding if it is not in commits_data."""
+    commits = props.commits
+    head_id = commits[0].commit_id if len(commits) else None
+
+    # Build the rows in plain Python first so the RNA writes below run back
+    # to back without any parsing in between
+    rows = []
+    for commit_data in commits_data:
+        commit_id = commit_data.get("id", "")[:8]
+        if commit_id == head_id:
+            break
+        rows.append((
+            commit_id,
+            commit_data.get("message", "").partition("\n")[0][:50],
+            commit_data.get("author", ""),
+            commit_data.get("date", ""),
+        ))
+    else:
+        commits.clear()
+        props.active_commit_index = 0
+        props.history_limit = max(HISTORY_LIMIT, len(commits_data))
+        head_id = None
+
+    add = commits.add
+    move = commits.move
+    last = len(commits)
+    for index, (commit_id, message, author, date) in enumerate(rows):
+        entry = add()
+        entry.commit_id = commit_id
+        entry.message = message
+        entry.author = author
+        entry.date = date
+        if last != index:
+            move(last, index)
+        last += 1
+
+    # Keep the same commit selected
+    if head_id is not None:
+        props.active_commit_index += len(rows)
+
+    while len(commits) > props.history_limit:
+        commits.remove(len(commits) - 1)
+
+def history_log_args(limit=HISTORY_LIMIT):
+    """Build the `auxin log` invocation used to fill the history panel."""
+    return ["log", "--format", "json", "--limit", str(limit)]
+
+def load_commit_history(props, output):
+    """Update the history list from the raw (bytes) output of ``history_log_args()``."""
+    # Parse JSON output
+    try:
+        output = output.strip()
+        if output:
+            # Try to parse as JSON array
+            merge_commit_history(props, json_loads(output))
+    except _get_json().JSONDecodeError:
+        # Fallback: parse plain text output
+        props.commits.clear()
+        lines = output.decode("utf-8", "replace").split("\n")
+        for i, line in enumerate(lines[:20]):  # Limit to 20 entries
+            if line.strip():
+                entry = props.commits.add()
+                parts = line.split(" ", 1)
+                entry.commit_id = parts[0][:8] if parts else ""
+                entry.message = parts[1][:50] if len(parts) > 1 else ""
+
+# (bytes per unit, unit, decimals) for format_file_size(), largest first
+_SIZE_UNITS = (
+    (1 << 30, "GB", 2),
+    (1 << 20, "MB", 1),
+    (1 << 10, "KB", 1),
+)
+
 def format_file_size(size_bytes):
     """Format file size in human-readable format."""
-    if size_bytes < 1024:
-        return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.1f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.1f} MB"
-    else:
-        return f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
+    for unit_size, unit, decimals in _SIZE_UNITS:
+        if size_bytes >= unit_size:
+            return f"{size_bytes / unit_size:.{decimals}f} {unit}"
+    return f"{size_bytes} B"
 
 # =============================================================================
 # Property Groups
@@ -162,7 +418,8 @@ class AuxinSceneProperties(PropertyGroup):
     include_metadata: BoolProperty(
         name="Include Metadata",
         description="Include scene metadata in commit message",
-        default=True
+        default=True,
+        update=_update_include_metadata
     )
 
     auto_stage: BoolProperty(
@@ -199,32 +456,115 @@ class AuxinSceneProperties(PropertyGroup):
 
     active_commit_index: IntProperty(name="Active Commit Index", default=0)
 
+    history_limit: IntProperty(
+        name="History Limit",
+        description="Number of commits kept in the history list",
+        default=HISTORY_LIMIT,
+        min=HISTORY_LIMIT,
+        options={'HIDDEN'}
+    )
+
     tag_input: StringProperty(
         name="Tags",
         description="Comma-separated tags for the commit",
         default=""
     )
 
+    metadata_cache: StringProperty(
+        name="Metadata Cache",
+        description="Scene metadata (JSON) captured at the last save or refresh",
+        default="",
+        options={'HIDDEN'}
+    )
+
 # =============================================================================
 # Operators
 # =============================================================================
 
-class AUXIN_OT_init_repository(Operator):
+class AuxinAsyncOperator:
+    """Mixin for operators that run an auxin CLI command on _EXECUTOR."""
+
+    def prepare(self, context):
+        raise NotImplementedError
+
+    @staticmethod
+    def run(job, cwd):
+        """Run the prepared job. Called from a worker thread; must not touch bpy."""
+        return run_auxin_command(job, cwd)
+
+    def finish(self, context, result):
+        raise NotImplementedError
+
+    def execute(self, context):
+        job = self.prepare(context)
+        if job is None:
+            return {'CANCELLED'}
+        return self.finish(context, self.run(job, get_project_path()))
+
+    def invoke(self, context, event):
+        if self.bl_idname in _PENDING:
+            self.report({'WARNING'}, f"{self.bl_label} is already running")
+            return {'CANCELLED'}
+
+        cwd = get_project_path()
+        if not cwd:
+            self.report({'ERROR'}, "No project directory - save your file first")
+            return {'CANCELLED'}
+
+        job = self.prepare(context)
+        if job is None:
+            return {'CANCELLED'}
+
+        _PENDING[self.bl_idname] = _EXECUTOR.submit(self.run, job, cwd)
+        props = context.scene.auxin
+        self._prior_status = props.last_status
+        props.last_status = f"{self.bl_label}..."
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        future = _PENDING[self.bl_idname]
+        if not future.done():
+            return {'PASS_THROUGH'}
+
+        del _PENDING[self.bl_idname]
+        context.window_manager.event_timer_remove(self._timer)
+
+        # Put back the status replaced by the "running" message; finish()
+        # overwrites it on success and leaves it alone on failure
+        context.scene.auxin.last_status = self._prior_status
+        return self.finish(context, future.result())
+
+    def cancel(self, context):
+        # Blender tears down modal handlers on file load; forget the job so
+        # the operator can be started again.
+        _PENDING.pop(self.bl_idname, None)
+        context.window_manager.event_timer_remove(self._timer)
+
+class AUXIN_OT_init_repository(AuxinAsyncOperator, Operator):
     """Initialize a new Auxin repository for the current Blender project"""
     bl_idname = "auxin.init_repository"
     bl_label = "Initialize Repository"
     bl_description = "Initialize Auxin version control for this project"
     bl_options = {'REGISTER', 'UNDO'}
 
-    def execute(self, context):
+    def prepare(self, context):
         filepath = get_blend_file()
         if not filepath:
             self.report({'ERROR'}, "Save your file first")
-            return {'CANCELLED'}
+            return None
 
-        result = run_auxin_command(["init", "--type", "blender", filepath])
+        return ["init", "--type", "blender", filepath]
 
+    def finish(self, context, result):
         if result["success"]:
+            _invalidate_status_cache()
             context.scene.auxin.repo_initialized = True
             context.scene.auxin.last_status = "Repository initialized"
             self.report({'INFO'}, "Repository initialized successfully")
@@ -234,21 +574,23 @@ class AUXIN_OT_init_repository(Operator):
 
         return {'FINISHED'}
 
-class AUXIN_OT_add_all(Operator):
+class AUXIN_OT_add_all(AuxinAsyncOperator, Operator):
     """Stage all changes for the next commit"""
     bl_idname = "auxin.add_all"
     bl_label = "Stage All Changes"
     bl_description = "Stage all changes for the next commit"
     bl_options = {'REGISTER'}
 
-    def execute(self, context):
+    def prepare(self, context):
         # First save the file
         if bpy.data.is_dirty:
             bpy.ops.wm.save_mainfile()
 
-        result = run_auxin_command(["add", "--all"])
+        return ["add", "--all"]
 
+    def finish(self, context, result):
         if result["success"]:
+            _invalidate_status_cache()
             context.scene.auxin.last_status = "All changes staged"
             self.report({'INFO'}, "All changes staged")
         else:
@@ -257,30 +599,24 @@ class AUXIN_OT_add_all(Operator):
 
         return {'FINISHED'}
 
-class AUXIN_OT_commit(Operator):
+class AUXIN_OT_commit(AuxinAsyncOperator, Operator):
     """Create a commit with the current changes"""
     bl_idname = "auxin.commit"
     bl_label = "Commit Changes"
     bl_description = "Create a commit with the current changes"
     bl_options = {'REGISTER', 'UNDO'}
 
-    def execute(self, context):
+    def prepare(self, context):
         props = context.scene.auxin
 
         if not props.commit_message.strip():
             self.report({'ERROR'}, "Please enter a commit message")
-            return {'CANCELLED'}
+            return None
 
         # Save the file first
         if bpy.data.is_dirty:
             bpy.ops.wm.save_mainfile()
 
-        # Auto stage if enabled
-        if props.auto_stage:
-            stage_result = run_auxin_command(["add", "--all"])
-            if not stage_result["success"]:
-                self.report({'WARNING'}, f"Staging warning: {stage_result['error']}")
-
         # Build commit command with metadata
         message = props.commit_message.strip()
 
@@ -288,84 +624,115 @@ class AUXIN_OT_commit(Operator):
             metadata = extract_scene_metadata()
 
             # Format metadata as part of the message
-            metadata_lines = [
-                f"\n\nScenes: {metadata['scene_count']}",
-                f"Active Scene: {metadata['active_scene']}",
-                f"Objects: {metadata['object_count']}",
-                f"Meshes: {metadata['mesh_count']}",
-                f"Lights: {metadata['light_count']}",
-                f"Cameras: {metadata['camera_count']}",
-                f"Materials: {metadata['material_count']}",
-                f"Render Engine: {metadata['render_engine']}",
-                f"Resolution: {metadata['resolution_x']}x{metadata['resolution_y']}",
-                f"Frame Range: {metadata['frame_start']}-{metadata['frame_end']}",
-                f"FPS: {metadata['fps']}",
-                f"Blender Version: {metadata['blender_version']}",
-            ]
+            message += _COMMIT_METADATA_TEMPLATE.format_map(metadata)
 
             if metadata['file_size'] > 0:
                 size_mb = metadata['file_size'] / (1024 * 1024)
-                metadata_lines.append(f"File Size: {size_mb:.2f} MB")
+                message += f"\nFile Size: {size_mb:.2f} MB"
 
             if props.tag_input.strip():
-                metadata_lines.append(f"Tags: {props.tag_input.strip()}")
+                message += f"\nTags: {props.tag_input.strip()}"
+
+        return (props.auto_stage, message)
+
+    @staticmethod
+    def run(job, cwd):
+        auto_stage, message = job
 
-            message += "".join(metadata_lines)
+        # Auto stage if enabled
+        stage_result = None
+        if auto_stage:
+            stage_result = run_auxin_command(["add", "--all"], cwd)
+
+        result = run_auxin_command(["commit", "-m", message], cwd)
+        result["stage_result"] = stage_result
+
+        # Fetch the updated history here as well, so the UI thread doesn't
+        # block on a separate refresh once the commit lands
+        if result["success"]:
+            result["history"] = run_auxin_command(history_log_args(), cwd, raw=True)
+
+        return result
 
-        result = run_auxin_command(["commit", "-m", message])
+    def finish(self, context, result):
+        props = context.scene.auxin
+
+        stage_result = result["stage_result"]
+        if stage_result and not stage_result["success"]:
+            self.report({'WARNING'}, f"Staging warning: {stage_result['error']}")
 
         if result["success"]:
+            _invalidate_status_cache()
             props.commit_message = ""
             props.tag_input = ""
             props.last_status = "Commit created successfully"
             self.report({'INFO'}, "Commit created successfully")
 
             # Refresh commit history
-            bpy.ops.auxin.refresh_history()
+            history = result["history"]
+            if history["success"]:
+                load_commit_history(props, history["output"])
+            else:
+                self.report({'WARNING'}, f"Could not load history: {history['error']}")
         else:
             self.report({'ERROR'}, result["error"])
             return {'CANCELLED'}
 
         return {'FINISHED'}
 
-class AUXIN_OT_refresh_history(Operator):
+class AUXIN_OT_refresh_history(AuxinAsyncOperator, Operator):
     """Refresh the commit history"""
     bl_idname = "auxin.refresh_history"
     bl_label = "Refresh History"
     bl_description = "Refresh the commit history from the repository"
     bl_options = {'REGISTER'}
 
-    def execute(self, context):
+    def prepare(self, context):
+        return history_log_args()
+
+    @staticmethod
+    def run(job, cwd):
+        return run_auxin_command(job, cwd, raw=True)
+
+    def finish(self, context, result):
         props = context.scene.auxin
 
-        result = run_auxin_command(["log", "--json"])
+        if result["success"]:
+            load_commit_history(props, result["output"])
+
+            props.last_status = f"Loaded {len(props.commits)} commits"
+            self.report({'INFO'}, f"Loaded {len(props.commits)} commits")
+        else:
+            self.report({'WARNING'}, f"Could not load history: {result['error']}")
+
+        return {'FINISHED'}
+
+class AUXIN_OT_load_more_history(AuxinAsyncOperator, Operator):
+    """Load older commits into the history"""
+    bl_idname = "auxin.load_more_history"
+    bl_label = "Load More History"
+    bl_description = "Load older commits into the history list"
+    bl_options = {'REGISTER'}
+
+    def prepare(self, context):
+        self._limit = context.scene.auxin.history_limit + HISTORY_LIMIT
+        return history_log_args(self._limit)
+
+    @staticmethod
+    def run(job, cwd):
+        return run_auxin_command(job, cwd, raw=True)
+
+    def finish(self, context, result):
+        props = context.scene.auxin
 
         if result["success"]:
-            # Clear existing commits
+            # merge_commit_history() only prepends, so rebuild the list from
+            # the longer log and keep the same row selected
+            active_index = props.active_commit_index
             props.commits.clear()
-
-            # Parse JSON output
-            try:
-                output = result["output"].strip()
-                if output:
-                    # Try to parse as JSON array
-                    commits_data = json.loads(output)
-
-                    for commit_data in commits_data:
-                        entry = props.commits.add()
-                        entry.commit_id = commit_data.get("id", "")[:8]
-                        entry.message = commit_data.get("message", "").split("\n")[0][:50]
-                        entry.author = commit_data.get("author", "")
-                        entry.date = commit_data.get("date", "")
-            except json.JSONDecodeError:
-                # Fallback: parse plain text output
-                lines = result["output"].strip().split("\n")
-                for i, line in enumerate(lines[:20]):  # Limit to 20 entries
-                    if line.strip():
-                        entry = props.commits.add()
-                        parts = line.split(" ", 1)
-                        entry.commit_id = parts[0][:8] if parts else ""
-                        entry.message = parts[1][:50] if len(parts) > 1 else ""
+            load_commit_history(props, result["output"])
+            props.history_limit = self._limit
+            props.active_commit_index = min(active_index, max(len(props.commits) - 1, 0))
 
             props.last_status = f"Loaded {len(props.commits)} commits"
             self.report({'INFO'}, f"Loaded {len(props.commits)} commits")
@@ -402,6 +769,7 @@ class AUXIN_OT_restore_commit(Operator):
         result = run_auxin_command(["restore", self.commit_id])
 
         if result["success"]:
+            _invalidate_status_cache()
             context.scene.auxin.last_status = f"Restored to {self.commit_id}"
             self.report({'INFO'}, f"Restored to commit {self.commit_id}")
 
@@ -413,42 +781,29 @@ class AUXIN_OT_restore_commit(Operator):
 
         return {'FINISHED'}
 
-class AUXIN_OT_check_status(Operator):
+class AUXIN_OT_check_status(AuxinAsyncOperator, Operator):
     """Check repository status"""
     bl_idname = "auxin.check_status"
     bl_label = "Check Status"
     bl_description = "Check the current repository status"
     bl_options = {'REGISTER'}
 
-    def execute(self, context):
-        props = context.scene.auxin
+    def prepare(self, context):
+        self._status_key = _status_key()
+        return ["status"]
 
-        result = run_auxin_command(["status"])
+    def finish(self, context, result):
+        props = context.scene.auxin
 
+        apply_status_result(props, result)
         if result["success"]:
-            # Parse status output to check if initialized
-            output = result["output"]
-            if "not an oxen repository" in output.lower():
-                props.repo_initialized = False
-                props.last_status = "Not initialized"
-            else:
-                props.repo_initialized = True
-                # Count changes
-                lines = output.strip().split("\n")
-                props.last_status = f"{len(lines)} file(s) changed"
+            _remember_status(self._status_key, props)
 
-            self.report({'INFO'}, props.last_status)
-        else:
-            if "not an oxen repository" in result["error"].lower():
-                props.repo_initialized = False
-                props.last_status = "Not initialized"
-            else:
-                props.last_status = result["error"]
-            self.report({'INFO'}, props.last_status)
+        self.report({'INFO'}, props.last_status)
 
         return {'FINISHED'}
 
-class AUXIN_OT_acquire_lock(Operator):
+class AUXIN_OT_acquire_lock(AuxinAsyncOperator, Operator):
     """Acquire exclusive lock for editing"""
     bl_idname = "auxin.acquire_lock"
     bl_label = "Acquire Lock"
@@ -463,10 +818,11 @@ class AUXIN_OT_acquire_lock(Operator):
         max=24
     )
 
-    def execute(self, context):
-        props = context.scene.auxin
+    def prepare(self, context):
+        return ["lock", "acquire", "--timeout", str(self.timeout)]
 
-        result = run_auxin_command(["lock", "acquire", "--timeout", str(self.timeout)])
+    def finish(self, context, result):
+        props = context.scene.auxin
 
         if result["success"]:
             props.is_locked = True
@@ -479,17 +835,18 @@ class AUXIN_OT_acquire_lock(Operator):
 
         return {'FINISHED'}
 
-class AUXIN_OT_release_lock(Operator):
+class AUXIN_OT_release_lock(AuxinAsyncOperator, Operator):
     """Release the current lock"""
     bl_idname = "auxin.release_lock"
     bl_label = "Release Lock"
     bl_description = "Release the lock you currently hold"
     bl_options = {'REGISTER'}
 
-    def execute(self, context):
-        props = context.scene.auxin
+    def prepare(self, context):
+        return ["lock", "release"]
 
-        result = run_auxin_command(["lock", "release"])
+    def finish(self, context, result):
+        props = context.scene.auxin
 
         if result["success"]:
             props.is_locked = False
@@ -502,21 +859,21 @@ class AUXIN_OT_release_lock(Operator):
 
         return {'FINISHED'}
 
-class AUXIN_OT_check_lock_status(Operator):
+class AUXIN_OT_check_lock_status(AuxinAsyncOperator, Operator):
     """Check lock status"""
     bl_idname = "auxin.check_lock_status"
     bl_label = "Check Lock Status"
     bl_description = "Check the current lock status"
     bl_options = {'REGISTER'}
 
-    def execute(self, context):
-        props = context.scene.auxin
+    def prepare(self, context):
+        return ["lock", "status"]
 
-        result = run_auxin_command(["lock", "status"])
+    def finish(self, context, result):
+        props = context.scene.auxin
 
         if result["success"]:
-            output = result["output"].lower()
-            if "not locked" in output or "no lock" in output:
+            if _NOT_LOCKED_RE.search(result["output"]):
                 props.is_locked = False
                 props.lock_holder = ""
                 props.last_status = "No lock held"
@@ -531,17 +888,18 @@ class AUXIN_OT_check_lock_status(Operator):
 
         return {'FINISHED'}
 
-class AUXIN_OT_push(Operator):
+class AUXIN_OT_push(AuxinAsyncOperator, Operator):
     """Push commits to remote repository"""
     bl_idname = "auxin.push"
     bl_label = "Push"
     bl_description = "Push local commits to the remote repository"
     bl_options = {'REGISTER'}
 
-    def execute(self, context):
-        props = context.scene.auxin
+    def prepare(self, context):
+        return ["push"]
 
-        result = run_auxin_command(["push"])
+    def finish(self, context, result):
+        props = context.scene.auxin
 
         if result["success"]:
             props.last_status = "Pushed to remote"
@@ -552,30 +910,55 @@ class AUXIN_OT_push(Operator):
 
         return {'FINISHED'}
 
-class AUXIN_OT_pull(Operator):
+def _revert_mainfile():
+    """Timer callback that reloads the .blend file from disk."""
+    bpy.ops.wm.revert_mainfile()
+    return None
+
+class AUXIN_OT_pull(AuxinAsyncOperator, Operator):
     """Pull commits from remote repository"""
     bl_idname = "auxin.pull"
     bl_label = "Pull"
     bl_description = "Pull commits from the remote repository"
     bl_options = {'REGISTER'}
 
-    def execute(self, context):
-        props = context.scene.auxin
+    def prepare(self, context):
+        self._file_key = _status_key()
+        return ["pull"]
 
-        result = run_auxin_command(["pull"])
+    def finish(self, context, result):
+        props = context.scene.auxin
 
         if result["success"]:
+            _invalidate_status_cache()
             props.last_status = "Pulled from remote"
             self.report({'INFO'}, "Pulled successfully")
 
-            # Reload the file if it was updated
-            bpy.ops.wm.revert_mainfile()
+            # Reload the file if it was updated; a no-op pull leaves its
+            # mtime alone, so skip the full .blend reload
+            if _status_key() != self._file_key:
+                # Reload from a timer: a file load tears down modal handlers,
+                # including this operator's while finish() is still running
+                bpy.app.timers.register(_revert_mainfile)
         else:
             self.report({'ERROR'}, result["error"])
             return {'CANCELLED'}
 
         return {'FINISHED'}
 
+class AUXIN_OT_refresh_metadata(Operator):
+    """Refresh the scene metadata shown in the commit panel"""
+    bl_idname = "auxin.refresh_metadata"
+    bl_label = "Refresh Metadata"
+    bl_description = "Recompute the scene metadata shown in the commit panel"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        # Rescan rather than reuse tallies the cache key may not have seen change
+        _invalidate_metadata_cache()
+        update_metadata_cache(context.scene)
+        return {'FINISHED'}
+
 class AUXIN_OT_open_in_terminal(Operator):
     """Open terminal in project directory"""
     bl_idname = "auxin.open_terminal"
@@ -589,22 +972,16 @@ class AUXIN_OT_open_in_terminal(Operator):
             self.report({'ERROR'}, "Save your file first")
             return {'CANCELLED'}
 
-        import platform
-        system = platform.system()
-
         try:
-            if system == "Darwin":  # macOS
+            if sys.platform == "darwin":  # macOS
                 subprocess.Popen(["open", "-a", "Terminal", project_path])
-            elif system == "Linux":
-                # Try common terminal emulators
-                terminals = ["gnome-terminal", "konsole", "xterm", "terminator"]
-                for term in terminals:
-                    try:
-                        subprocess.Popen([term, "--working-directory", project_path])
-                        break
-                    except FileNotFoundError:
-                        continue
-            elif system == "Windows":
+            elif sys.platform.startswith("linux"):
+                terminal = find_linux_terminal()
+                if terminal is None:
+                    self.report({'ERROR'}, "No supported terminal emulator found")
+                    return {'CANCELLED'}
+                subprocess.Popen([terminal, "--working-directory", project_path])
+            elif sys.platform == "win32":
                 subprocess.Popen(["cmd", "/c", "start", "cmd", "/k", f"cd /d {project_path}"])
 
             self.report({'INFO'}, f"Opened terminal in {project_path}")
@@ -689,26 +1066,42 @@ class AUXIN_PT_commit_panel(Panel):
         col.prop(props, "include_metadata")
         col.prop(props, "auto_stage")
 
-        # Scene info
+        # Scene info, as captured at the last save or refresh. draw() runs on
+        # every UI event, so it never walks the scene itself.
         if props.include_metadata:
             box = layout.box()
-            box.label(text="Scene Metadata:", icon='INFO')
+            row = box.row()
+            row.label(text="Scene Metadata:", icon='INFO')
+            row.operator("auxin.refresh_metadata", text="", icon='FILE_REFRESH')
 
-            metadata = extract_scene_metadata()
-            col = box.column(align=True)
-            col.scale_y = 0.8
-            col.label(text=f"Objects: {metadata['object_count']}")
-            col.label(text=f"Materials: {metadata['material_count']}")
-            col.label(text=f"Engine: {metadata['render_engine']}")
-            col.label(text=f"Frames: {metadata['frame_start']}-{metadata['frame_end']}")
-            if metadata['file_size'] > 0:
-                col.label(text=f"Size: {format_file_size(metadata['file_size'])}")
+            if props.metadata_cache:
+                metadata = json_loads(props.metadata_cache)
+                col = box.column(align=True)
+                col.scale_y = 0.8
+                col.label(text=f"Objects: {metadata['object_count']}")
+                col.label(text=f"Materials: {metadata['material_count']}")
+                col.label(text=f"Engine: {metadata['render_engine']}")
+                col.label(text=f"Frames: {metadata['frame_start']}-{metadata['frame_end']}")
+                if metadata['file_size'] > 0:
+                    col.label(text=f"Size: {format_file_size(metadata['file_size'])}")
+            else:
+                box.label(text="Save or refresh to capture metadata")
 
         # Commit button
         row = layout.row()
         row.scale_y = 1.5
         row.operator("auxin.commit", text="Commit", icon='EXPORT')
 
+class AUXIN_UL_commits(UIList):
+    """Commit history list"""
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        if self.layout_type in {'DEFAULT', 'COMPACT'}:
+            layout.label(text=f"{item.commit_id}: {item.message}")
+        elif self.layout_type == 'GRID':
+            layout.alignment = 'CENTER'
+            layout.label(text=item.commit_id)
+
 class AUXIN_PT_history_panel(Panel):
     """Commit history panel"""
     bl_label = "History"
@@ -731,43 +1124,23 @@ class AUXIN_PT_history_panel(Panel):
         row = layout.row()
         row.operator("auxin.refresh_history", text="Refresh", icon='FILE_REFRESH')
 
-        # Commit list
+        # Commit list. template_list only draws the rows in view, so the
+        # cost doesn't grow with the length of the history.
         if props.commits:
-            box = layout.box()
-            for i, commit in enumerate(props.commits):
-                row = box.row()
+            layout.template_list(
+                "AUXIN_UL_commits", "", props, "commits", props, "active_commit_index", rows=8
+            )
 
-                # Highlight selected
-                if i == props.active_commit_index:
-                    row.alert = True
-
-                col = row.column()
-                col.scale_y = 0.8
-                col.label(text=f"{commit.commit_id}: {commit.message}")
-
-                # Select button
-                op = row.operator("auxin.select_commit", text="", icon='RESTRICT_SELECT_OFF')
-                op.index = i
+            # A full list means there may be older commits to fetch
+            if len(props.commits) >= props.history_limit:
+                layout.operator("auxin.load_more_history", text="Load More", icon='TRIA_DOWN')
 
             # Restore button
-            if len(props.commits) > 0:
-                layout.separator()
-                layout.operator("auxin.restore_commit", text="Restore Selected", icon='LOOP_BACK')
+            layout.separator()
+            layout.operator("auxin.restore_commit", text="Restore Selected", icon='LOOP_BACK')
         else:
             layout.label(text="No commits yet", icon='INFO')
 
-class AUXIN_OT_select_commit(Operator):
-    """Select a commit from the history"""
-    bl_idname = "auxin.select_commit"
-    bl_label = "Select Commit"
-    bl_options = {'REGISTER', 'INTERNAL'}
-
-    index: IntProperty()
-
-    def execute(self, context):
-        context.scene.auxin.active_commit_index = self.index
-        return {'FINISHED'}
-
 class AUXIN_PT_remote_panel(Panel):
     """Remote operations panel"""
     bl_label = "Remote"
@@ -837,6 +1210,11 @@ class AUXIN_PT_tools_panel(Panel):
 # Addon Preferences
 # =============================================================================
 
+def _update_auxin_path(self, context):
+    """Use the configured CLI path for subsequent auxin commands."""
+    global _AUXIN_PATH
+    _AUXIN_PATH = self.auxin_path or None
+
 class AuxinAddonPreferences(AddonPreferences):
     bl_idname = __name__
 
@@ -844,7 +1222,8 @@ class AuxinAddonPreferences(AddonPreferences):
         name="Auxin CLI Path",
         description="Path to the auxin CLI executable (leave empty for system PATH)",
         default="",
-        subtype='FILE_PATH'
+        subtype='FILE_PATH',
+        update=_update_auxin_path
     )
 
     auto_check_status: BoolProperty(
@@ -867,9 +1246,91 @@ class AuxinAddonPreferences(AddonPreferences):
 # Auto-save Handler
 # =============================================================================
 
+# Quiet period after the last save/load before the status check runs
+STATUS_CHECK_DELAY = 0.5
+
+# Interval at which the scheduled status check's result is polled
+STATUS_POLL_INTERVAL = 0.1
+
+# Status check started by the save/load handlers: (blend file, status key, future)
+_STATUS_JOB = None
+
+def _redraw_sidebar():
+    """Redraw the 3D View sidebar after a timer changed the status props."""
+    # Timers don't trigger a redraw, so tag the areas by hand
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+def _run_scheduled_status_check():
+    """Timer callback that starts the status check scheduled by the save/load handlers."""
+    global _STATUS_JOB
+
+    # A new, unsaved file may have been opened since the check was scheduled
+    filepath = get_blend_file()
+    if not filepath:
+        return None
+
+    # Skip the CLI when the file hasn't changed since the last successful
+    # check. A reload brings back the status props saved in the file, which
+    # predate that check, so restore its result.
+    key = _status_key()
+    if key is not None and key == _STATUS_CACHE["key"]:
+        props = bpy.context.scene.auxin
+        props.repo_initialized, props.last_status = _STATUS_CACHE["val"]
+        _redraw_sidebar()
+        return None
+
+    # Only one check at a time; try again once the running one is done
+    if _STATUS_JOB is not None:
+        return STATUS_CHECK_DELAY
+
+    future = _EXECUTOR.submit(run_auxin_command, ["status"], os.path.dirname(filepath))
+    _STATUS_JOB = (filepath, key, future)
+    # Persistent, so a file load while the command runs can't drop the poll
+    # and leave _STATUS_JOB set; the poll discards results for another file
+    bpy.app.timers.register(
+        _poll_status_check, first_interval=STATUS_POLL_INTERVAL, persistent=True
+    )
+    return None
+
+def _poll_status_check():
+    """Timer callback that applies the scheduled status check once it is done."""
+    global _STATUS_JOB
+    filepath, key, future = _STATUS_JOB
+    if not future.done():
+        return STATUS_POLL_INTERVAL
+
+    _STATUS_JOB = None
+
+    # Drop the result if another file was loaded while the command ran
+    if get_blend_file() != filepath:
+        return None
+
+    props = bpy.context.scene.auxin
+    result = future.result()
+    apply_status_result(props, result)
+    if result["success"]:
+        _remember_status(key, props)
+
+    _redraw_sidebar()
+    return None
+
+def _schedule_status_check():
+    """Check status once saves/loads settle, so a burst of saves runs one check."""
+    timers = bpy.app.timers
+    if timers.is_registered(_run_scheduled_status_check):
+        timers.unregister(_run_scheduled_status_check)
+    timers.register(_run_scheduled_status_check, first_interval=STATUS_CHECK_DELAY)
+
 @bpy.app.handlers.persistent
 def auxin_save_handler(dummy):
     """Handler called after saving a file."""
+    _invalidate_metadata_cache()
+    if bpy.context.scene.auxin.include_metadata:
+        update_metadata_cache(bpy.context.scene)
+
     # Check if auto-staging is enabled in preferences
     try:
         prefs = bpy.context.preferences.addons[__name__].preferences
@@ -880,11 +1341,15 @@ def auxin_save_handler(dummy):
 
     # Update status after save
     if bpy.context.scene.auxin.repo_initialized:
-        bpy.ops.auxin.check_status()
+        _schedule_status_check()
 
 @bpy.app.handlers.persistent
 def auxin_load_handler(dummy):
     """Handler called after loading a file."""
+    _invalidate_metadata_cache()
+    if bpy.context.scene.auxin.include_metadata:
+        update_metadata_cache(bpy.context.scene)
+
     # Check repository status when file is loaded
     try:
         prefs = bpy.context.preferences.addons[__name__].preferences
@@ -895,7 +1360,7 @@ def auxin_load_handler(dummy):
 
     # Check if this is an auxin repository
     if get_blend_file():
-        bpy.ops.auxin.check_status()
+        _schedule_status_check()
 
 # =============================================================================
 # Registration
@@ -908,6 +1373,7 @@ classes = (
     AUXIN_OT_add_all,
     AUXIN_OT_commit,
     AUXIN_OT_refresh_history,
+    AUXIN_OT_load_more_history,
     AUXIN_OT_restore_commit,
     AUXIN_OT_check_status,
     AUXIN_OT_acquire_lock,
@@ -915,10 +1381,11 @@ classes = (
     AUXIN_OT_check_lock_status,
     AUXIN_OT_push,
     AUXIN_OT_pull,
+    AUXIN_OT_refresh_metadata,
     AUXIN_OT_open_in_terminal,
-    AUXIN_OT_select_commit,
     AUXIN_PT_main_panel,
     AUXIN_PT_commit_panel,
+    AUXIN_UL_commits,
     AUXIN_PT_history_panel,
     AUXIN_PT_remote_panel,
     AUXIN_PT_lock_panel,
@@ -932,6 +1399,13 @@ def register():
 
     bpy.types.Scene.auxin = bpy.props.PointerProperty(type=AuxinSceneProperties)
 
+    # Pick up a CLI path saved in the user's preferences
+    try:
+        prefs = bpy.context.preferences.addons[__name__].preferences
+        _update_auxin_path(prefs, bpy.context)
+    except KeyError:
+        pass
+
     # Register handlers
     bpy.app.handlers.save_post.append(auxin_save_handler)
     bpy.app.handlers.load_post.append(auxin_load_handler)
@@ -942,11 +1416,15 @@ def unregister():
         bpy.app.handlers.save_post.remove(auxin_save_handler)
     if auxin_load_handler in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.remove(auxin_load_handler)
+    for timer in (_run_scheduled_status_check, _poll_status_check):
+        if bpy.app.timers.is_registered(timer):
+            bpy.app.timers.unregister(timer)
 
     del bpy.types.Scene.auxin
 
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    # Unregister in reverse order, indexing the tuple directly
+    for i in range(len(classes) - 1, -1, -1):
+        bpy.utils.unregister_class(classes[i])
 
 if __name__ == "__main__":
     register()
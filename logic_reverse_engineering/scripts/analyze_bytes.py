@@ -4,173 +4,327 @@ Analyze bytes at a specific offset in a binary file.
 Interprets bytes as various data types to identify the format.
 """
 
+import contextlib
+import mmap
+import os
 import struct
 import sys
 import argparse
+import array
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; scans fall back to pure Python
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; scans use NumPy (or pure Python) instead
+    njit = None
+
+# Precompiled formats for print_interpretations()
+_F32_LE = struct.Struct('<f')
+_F32_BE = struct.Struct('>f')
+
+# Interpretations shown for each read length, as (label, format spec), in
+# the order _interpret() returns their values
+_INTERPRETATIONS = {
+    4: (('Float (LE)', '.6f'), ('Float (BE)', '.6f'),
+        ('Uint32 (LE)', 'd'), ('Uint32 (BE)', 'd'),
+        ('Int32 (LE)', 'd'), ('Int32 (BE)', 'd')),
+    2: (('Uint16 (LE)', 'd'), ('Uint16 (BE)', 'd')),
+    1: (('Uint8', 'd'), ('Int8', 'd')),
+}
+
+# The block printed for each read length, built once from _INTERPRETATIONS so
+# that each offset needs a single str.format() call
+_INTERPRETATION_TEMPLATES = {
+    length: "\n".join(["Interpretations:", "-" * 40]
+                      + [f"  {label + ':':<16}{{:>15{spec}}}" for label, spec in labels])
+    for length, labels in _INTERPRETATIONS.items()
+}
+
+# Byte sets for the string check in print_interpretations()
+_PRINTABLE_ASCII = bytes(range(0x20, 0x7F))
+_HIGH_BYTES = bytes(range(0x80, 0x100))
+
 
 def analyze_offset(filename, offset, byte_count=4):
     """Analyze bytes at a specific offset."""
+    analyze_offsets(filename, [offset], byte_count)
+
+
+def analyze_offsets(filename, offsets, byte_count=4):
+    """Analyze bytes at each of several offsets, opening and mapping the file once."""
     filepath = Path(filename)
 
-    if not filepath.exists():
+    try:
+        mapped = map_file(filepath)
+    except FileNotFoundError:
         print(f"Error: File not found: {filename}")
         sys.exit(1)
 
-    with open(filepath, 'rb') as f:
-        f.seek(offset)
-        data = f.read(byte_count)
+    with mapped as mm:
+        for offset in offsets:
+            print_interpretations(filepath.name, offset, mm[offset:offset + byte_count], byte_count)
+
+
+def _interpret(data):
+    """Return the values listed in _INTERPRETATIONS for 1, 2 or 4 bytes of data."""
+    if len(data) == 4:
+        # Read the word once; the big-endian and signed readings are derived
+        # from it by byte-swapping and sign-extending rather than unpacked again
+        u_le = int.from_bytes(data, 'little')
+        u_be = (((u_le & 0xFF) << 24) | ((u_le & 0xFF00) << 8)
+                | ((u_le >> 8) & 0xFF00) | (u_le >> 24))
+        i_le = u_le - 0x100000000 if u_le >> 31 else u_le
+        i_be = u_be - 0x100000000 if u_be >> 31 else u_be
+        return (_F32_LE.unpack(data)[0], _F32_BE.unpack(data)[0],
+                u_le, u_be, i_le, i_be)
+
+    if len(data) == 2:
+        u_le = int.from_bytes(data, 'little')
+        return (u_le, ((u_le & 0xFF) << 8) | (u_le >> 8))
+
+    return (data[0], data[0] - 0x100 if data[0] & 0x80 else data[0])
+
+
+def print_interpretations(name, offset, data, byte_count):
+    """Print the bytes read from offset and their interpretations."""
+    # Collect the report and write it in one go rather than line by line
+    out = []
 
     if len(data) < byte_count:
-        print(f"Warning: Only read {len(data)} bytes (requested {byte_count})")
+        out.append(f"Warning: Only read {len(data)} bytes (requested {byte_count})")
 
-    print(f"\n{'='*60}")
-    print(f"File: {filepath.name}")
-    print(f"Offset: 0x{offset:X} ({offset} decimal)")
-    print(f"{'='*60}\n")
+    out.append(f"\n{'='*60}")
+    out.append(f"File: {name}")
+    out.append(f"Offset: 0x{offset:X} ({offset} decimal)")
+    out.append(f"{'='*60}\n")
 
     # Raw hex
     hex_str = ' '.join(f'{b:02x}' for b in data)
-    print(f"Raw Bytes: {hex_str}")
-    print()
+    out.append(f"Raw Bytes: {hex_str}")
+    out.append("")
+
+    # Try various interpretations if we have 1, 2 or 4 bytes
+    template = _INTERPRETATION_TEMPLATES.get(len(data))
+    if template:
+        out.append(template.format(*_interpret(data)))
+        if len(data) == 1 and 32 <= data[0] <= 126:
+            out.append(f"  ASCII:          '{chr(data[0])}'")
+
+    # String interpretation (if valid UTF-8 and printable). Stripping the
+    # printable ASCII bytes first settles most cases without decoding:
+    # nothing left means plain text, and a leftover control byte (the usual
+    # case for binary data) can never be printable.
+    rest = data.translate(None, _PRINTABLE_ASCII)
+    if not rest:
+        text = data.decode('ascii')
+    elif not rest.translate(None, _HIGH_BYTES):
+        # Invalid bytes decode to lone surrogates, which aren't printable
+        text = data.decode('utf-8', errors='surrogateescape')
+        if not text.isprintable():
+            text = ''
+    else:
+        text = ''
+    if text:
+        out.append(f"\nUTF-8 String: \"{text}\"")
 
-    # Try various interpretations if we have 4 bytes
-    if len(data) == 4:
-        print("Interpretations:")
-        print("-" * 40)
-
-        # Float (little-endian)
-        try:
-            val = struct.unpack('<f', data)[0]
-            print(f"  Float (LE):     {val:>15.6f}")
-        except:
-            print(f"  Float (LE):     [invalid]")
-
-        # Float (big-endian)
-        try:
-            val = struct.unpack('>f', data)[0]
-            print(f"  Float (BE):     {val:>15.6f}")
-        except:
-            print(f"  Float (BE):     [invalid]")
-
-        # Unsigned int (little-endian)
-        try:
-            val = struct.unpack('<I', data)[0]
-            print(f"  Uint32 (LE):    {val:>15}")
-        except:
-            print(f"  Uint32 (LE):    [invalid]")
-
-        # Unsigned int (big-endian)
-        try:
-            val = struct.unpack('>I', data)[0]
-            print(f"  Uint32 (BE):    {val:>15}")
-        except:
-            print(f"  Uint32 (BE):    [invalid]")
-
-        # Signed int (little-endian)
-        try:
-            val = struct.unpack('<i', data)[0]
-            print(f"  Int32 (LE):     {val:>15}")
-        except:
-            print(f"  Int32 (LE):     [invalid]")
-
-        # Signed int (big-endian)
-        try:
-            val = struct.unpack('>i', data)[0]
-            print(f"  Int32 (BE):     {val:>15}")
-        except:
-            print(f"  Int32 (BE):     [invalid]")
-
-    elif len(data) == 2:
-        print("Interpretations:")
-        print("-" * 40)
-
-        # Unsigned short
-        try:
-            val = struct.unpack('<H', data)[0]
-            print(f"  Uint16 (LE):    {val:>15}")
-        except:
-            pass
-
-        try:
-            val = struct.unpack('>H', data)[0]
-            print(f"  Uint16 (BE):    {val:>15}")
-        except:
-            pass
-
-    elif len(data) == 1:
-        print("Interpretations:")
-        print("-" * 40)
-        print(f"  Uint8:          {data[0]:>15}")
-        print(f"  Int8:           {struct.unpack('b', data)[0]:>15}")
-        if 32 <= data[0] <= 126:
-            print(f"  ASCII:          '{chr(data[0])}'")
-
-    # String interpretation (if printable)
-    try:
-        text = data.decode('utf-8')
-        if text.isprintable():
-            print(f"\nUTF-8 String: \"{text}\"")
-    except:
-        pass
+    out.append("")
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+# Encodings reported by scan_for_value(), indexed by encoding id
+ENC_NAMES = ('float_le', 'float_be', 'uint32_le', 'uint32_be')
+ENC_IDS = {name: i for i, name in enumerate(ENC_NAMES)}
 
-    print()
+# Bytes scanned per window by find_patterns()
+SCAN_WINDOW = 1 << 20
 
 
-def scan_for_value(filename, target_value, value_type='float'):
-    """Scan file for a specific value."""
+def map_file(path):
+    """Memory-map a file read-only (b'' if empty); raises FileNotFoundError."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if os.fstat(fd).st_size == 0:
+            return contextlib.nullcontext(b'')
+        return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+
+
+if njit is not None:
+    @njit(cache=True, boundscheck=False, nogil=True)
+    def _scan_words(buf, targets, first, start, step, out_offsets, out_targets):
+        """Record (offset, target row) pairs where buf matches targets; return (count, resume offset)."""
+        k_count = targets.shape[0]
+        n = 0
+        for i in range(start, buf.size - 3, step):
+            if n > out_offsets.size - k_count:
+                return n, i
+            # Nearly every offset fails on the first byte, so reject those
+            # with one table lookup before comparing against each target
+            b0 = buf[i]
+            if not first[b0]:
+                continue
+            for k in range(k_count):
+                if (b0 == targets[k, 0] and buf[i + 1] == targets[k, 1]
+                        and buf[i + 2] == targets[k, 2] and buf[i + 3] == targets[k, 3]):
+                    out_offsets[n] = i
+                    out_targets[n] = k
+                    n += 1
+        return n, buf.size
+else:
+    _scan_words = None
+
+
+def _find_patterns_jit(buf, targets, step):
+    """Collect every match from the Numba kernel, growing its output buffers as needed."""
+    table = np.array([list(t) for t in targets], dtype=np.uint8).reshape(-1, 4)
+    first = np.zeros(256, dtype=np.bool_)
+    first[table[:, 0]] = True
+    found = [[] for _ in targets]
+    size = 1024
+    start = 0
+    while start < buf.size - 3:
+        out_offsets = np.empty(size, dtype=np.int64)
+        out_targets = np.empty(size, dtype=np.int64)
+        n, start = _scan_words(buf, table, first, start, step, out_offsets, out_targets)
+        for offset, k in zip(out_offsets[:n].tolist(), out_targets[:n].tolist()):
+            found[k].append(offset)
+        size *= 2
+    return found
+
+
+def find_patterns(data, targets, aligned=False):
+    """Return, for each 4-byte pattern in targets, every offset (or aligned offset) where it occurs."""
+    # Scan fixed-size windows rather than the whole buffer at once, so the
+    # temporaries below stay bounded and each window is still in cache while
+    # every target is compared against it. Consecutive windows overlap by 3
+    # bytes, so a match straddling a boundary is found exactly once. The
+    # window size is a multiple of 4, so window-relative alignment holds.
+    starts = range(0, len(data) - 3, SCAN_WINDOW)
+
+    def scan(start):
+        return _find_patterns_in(data[start:start + SCAN_WINDOW + 3], targets, aligned)
+
+    # The Numba kernel and NumPy's comparisons release the GIL, so windows
+    # can be scanned in parallel on threads. bytes.find holds the GIL, so the
+    # pure-Python fallback stays sequential.
+    workers = os.cpu_count() or 1
+    if np is not None and workers > 1 and len(starts) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(scan, starts))
+    else:
+        results = map(scan, starts)
+
+    found = [[] for _ in targets]
+    for start, window_hits in zip(starts, results):
+        for offsets, hits in zip(found, window_hits):
+            offsets.extend(start + i for i in hits)
+    return found
+
+
+def _find_all(data, target_bytes, aligned=False):
+    """Return every offset, overlaps included, where target_bytes occurs in data."""
+    found = []
+    pos = data.find(target_bytes)
+    while pos != -1:
+        if aligned:
+            if pos % 4 == 0:
+                found.append(pos)
+            # Resume at the next multiple of 4
+            pos = data.find(target_bytes, (pos | 3) + 1)
+        else:
+            found.append(pos)
+            pos = data.find(target_bytes, pos + 1)
+    return found
+
+
+def _find_patterns_in(data, targets, aligned=False):
+    """Match targets against one window of the scanned data."""
+    if np is None:
+        return [_find_all(data, target_bytes, aligned) for target_bytes in targets]
+
+    if _scan_words is not None:
+        return _find_patterns_jit(np.frombuffer(data, dtype=np.uint8), targets,
+                                  4 if aligned else 1)
+
+    # Compare whole uint32 words instead of slicing byte by byte: one view
+    # per byte phase covers every unaligned offset, and every target is
+    # compared against each view in turn. Aligned scans need only phase 0.
+    target_words = [int.from_bytes(t, 'little') for t in targets]
+    hits = [[] for _ in targets]
+    for phase in range(1 if aligned else 4):
+        count = (len(data) - phase) // 4
+        if count <= 0:
+            continue
+        words = np.frombuffer(data, dtype='<u4', count=count, offset=phase)
+        for k, target_word in enumerate(target_words):
+            hits[k].append(np.flatnonzero(words == target_word) * 4 + phase)
+
+    return [np.sort(np.concatenate(h)).tolist() if h else [] for h in hits]
+
+
+def scan_for_value(filename, target_value, value_type='float', aligned=False):
+    """Scan file for a specific value, optionally at 4-byte aligned offsets only."""
     filepath = Path(filename)
 
-    if not filepath.exists():
+    # Map the file instead of reading it: pages load on demand and the
+    # scan works on the mapping directly, without a full in-memory copy.
+    try:
+        mapped = map_file(filepath)
+    except FileNotFoundError:
         print(f"Error: File not found: {filename}")
         sys.exit(1)
 
-    with open(filepath, 'rb') as f:
-        data = f.read()
-
-    print(f"\n{'='*60}")
-    print(f"Scanning: {filepath.name}")
-    print(f"Looking for: {target_value} (as {value_type})")
-    print(f"{'='*60}\n")
-
-    matches = []
-
-    if value_type == 'float':
-        # Scan for float (little-endian)
-        target_bytes = struct.pack('<f', float(target_value))
-        for i in range(len(data) - 3):
-            if data[i:i+4] == target_bytes:
-                matches.append((i, 'float_le'))
-
-        # Scan for float (big-endian)
-        target_bytes = struct.pack('>f', float(target_value))
-        for i in range(len(data) - 3):
-            if data[i:i+4] == target_bytes:
-                matches.append((i, 'float_be'))
-
-    elif value_type == 'int':
-        # Scan for uint32 (little-endian)
-        target_bytes = struct.pack('<I', int(target_value))
-        for i in range(len(data) - 3):
-            if data[i:i+4] == target_bytes:
-                matches.append((i, 'uint32_le'))
-
-        # Scan for uint32 (big-endian)
-        target_bytes = struct.pack('>I', int(target_value))
-        for i in range(len(data) - 3):
-            if data[i:i+4] == target_bytes:
-                matches.append((i, 'uint32_be'))
-
-    if matches:
-        print(f"Found {len(matches)} match(es):\n")
-        for offset, encoding in matches:
-            hex_bytes = ' '.join(f'{b:02x}' for b in data[offset:offset+4])
-            print(f"  Offset 0x{offset:04X} ({offset:>5}): {hex_bytes} [{encoding}]")
-    else:
-        print("No matches found.")
-
-    print()
+    with mapped as data:
+        # The scan walks the mapping front to back, so let the OS read ahead
+        if isinstance(data, mmap.mmap) and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            data.madvise(mmap.MADV_SEQUENTIAL)
+
+        print(f"\n{'='*60}")
+        print(f"Scanning: {filepath.name}")
+        if aligned:
+            print(f"Looking for: {target_value} (as {value_type}, 4-byte aligned offsets only)")
+        else:
+            print(f"Looking for: {target_value} (as {value_type})")
+        print(f"{'='*60}\n")
+
+        if value_type == 'float':
+            # Scan for float (little- and big-endian)
+            encodings = [ENC_IDS['float_le'], ENC_IDS['float_be']]
+            targets = [struct.pack('<f', float(target_value)),
+                       struct.pack('>f', float(target_value))]
+        elif value_type == 'int':
+            # Scan for uint32 (little- and big-endian)
+            encodings = [ENC_IDS['uint32_le'], ENC_IDS['uint32_be']]
+            targets = [struct.pack('<I', int(target_value)),
+                       struct.pack('>I', int(target_value))]
+        else:
+            encodings = []
+            targets = []
+
+        # Keep matches as parallel offset / encoding-id arrays rather than
+        # a tuple per hit
+        match_offsets = array.array('q')
+        match_encodings = array.array('b')
+        for enc_id, offsets in zip(encodings, find_patterns(data, targets, aligned)):
+            match_offsets.extend(offsets)
+            match_encodings.extend(array.array('b', [enc_id]) * len(offsets))
+
+        if match_offsets:
+            print(f"Found {len(match_offsets)} match(es):\n")
+            for offset, enc_id in zip(match_offsets, match_encodings):
+                hex_bytes = ' '.join(f'{b:02x}' for b in data[offset:offset+4])
+                print(f"  Offset 0x{offset:04X} ({offset:>5}): {hex_bytes} [{ENC_NAMES[enc_id]}]")
+        else:
+            print("No matches found.")
+
+        print()
 
 
 def main():
@@ -182,8 +336,9 @@ def main():
     # Analyze command
     analyze_parser = subparsers.add_parser('analyze', help='Analyze bytes at offset')
     analyze_parser.add_argument('file', help='Binary file to analyze')
-    analyze_parser.add_argument('offset', type=lambda x: int(x, 0),
-                               help='Offset (decimal or hex like 0x18B)')
+    analyze_parser.add_argument('offsets', nargs='+', metavar='offset',
+                               type=lambda x: int(x, 0),
+                               help='Offset(s) (decimal or hex like 0x18B)')
     analyze_parser.add_argument('--bytes', type=int, default=4,
                                help='Number of bytes to read (default: 4)')
 
@@ -193,6 +348,8 @@ def main():
     scan_parser.add_argument('value', help='Value to search for')
     scan_parser.add_argument('--type', choices=['float', 'int'], default='float',
                             help='Data type (default: float)')
+    scan_parser.add_argument('--aligned', action='store_true',
+                            help='Only check offsets that are multiples of 4')
 
     args = parser.parse_args()
 
@@ -201,9 +358,9 @@ def main():
         sys.exit(1)
 
     if args.command == 'analyze':
-        analyze_offset(args.file, args.offset, args.bytes)
+        analyze_offsets(args.file, args.offsets, args.bytes)
     elif args.command == 'scan':
-        scan_for_value(args.file, args.value, args.type)
+        scan_for_value(args.file, args.value, args.type, args.aligned)
 
 
 if __name__ == '__main__':